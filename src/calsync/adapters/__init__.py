@@ -1,6 +1,19 @@
 """Calendar adapters for CalSync."""
 
+from functools import lru_cache
+
 from calsync.adapters.base import CalendarAdapter
 from calsync.adapters.eventkit import EventKitAdapter
 
-__all__ = ["CalendarAdapter", "EventKitAdapter"]
+
+@lru_cache(maxsize=None)
+def get_adapter() -> EventKitAdapter:
+    """Get the shared EventKitAdapter instance.
+
+    One EKEventStore per process keeps authorization and EventKit's
+    internal calendar caches alive across commands.
+    """
+    return EventKitAdapter()
+
+
+__all__ = ["CalendarAdapter", "EventKitAdapter", "get_adapter"]
@@ -29,10 +29,32 @@ class CalendarAdapter(ABC):
         calendar_id: str,
         start_date: datetime,
         end_date: datetime,
+        title_prefix: Optional[str] = None,
     ) -> list[CalendarEvent]:
-        """Get events from a calendar within a time range."""
+        """Get events from a calendar within a time range.
+
+        With title_prefix, only events whose title starts with it are
+        returned; adapters may push that filter down to their backend.
+        """
         pass
 
+    def get_events_multi(
+        self,
+        calendar_ids: list[str],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> dict[str, list[CalendarEvent]]:
+        """Get events from multiple calendars within a time range.
+
+        Returns a dict mapping calendar ID to its events. Default
+        implementation queries each calendar separately; adapters can
+        override this with a single batched query.
+        """
+        return {
+            calendar_id: self.get_events(calendar_id, start_date, end_date)
+            for calendar_id in calendar_ids
+        }
+
     @abstractmethod
     def get_event_by_id(self, event_id: str) -> Optional[CalendarEvent]:
         """Get a single event by ID."""
@@ -52,6 +74,15 @@ class CalendarAdapter(ABC):
         """Create a new event."""
         pass
 
+    def create_events_batch(self, specs: list[dict]) -> list[CalendarEvent]:
+        """Create multiple events.
+
+        Each spec is a dict of create_event keyword arguments. Default
+        implementation creates events one by one; adapters can override
+        this to commit all events in a single transaction.
+        """
+        return [self.create_event(**spec) for spec in specs]
+
     @abstractmethod
     def update_event(
         self,
@@ -65,7 +96,24 @@ class CalendarAdapter(ABC):
         """Update an existing event."""
         pass
 
+    def update_events_batch(self, updates: list[dict]) -> list[CalendarEvent]:
+        """Update multiple events.
+
+        Each update is a dict of update_event keyword arguments. Default
+        implementation updates events one by one; adapters can override
+        this to commit all updates in a single transaction.
+        """
+        return [self.update_event(**update) for update in updates]
+
     @abstractmethod
     def delete_event(self, event_id: str) -> bool:
         """Delete an event. Returns True if successful."""
         pass
+
+    def delete_events_batch(self, event_ids: list[str]) -> int:
+        """Delete multiple events. Returns the number of deleted events.
+
+        Default implementation deletes events one by one; adapters can
+        override this to commit all deletions in a single transaction.
+        """
+        return sum(1 for event_id in event_ids if self.delete_event(event_id))
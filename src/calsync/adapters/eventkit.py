@@ -1,10 +1,14 @@
 """EventKit-based calendar adapter for macOS."""
 
+import sys
 import threading
+import time
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
 from EventKit import (
+    EKAuthorizationStatusFullAccess,
     EKEntityTypeEvent,
     EKEvent,
     EKEventAvailabilityBusy,
@@ -12,18 +16,38 @@ from EventKit import (
     EKEventStore,
     EKSpanThisEvent,
 )
-from Foundation import NSDate
+from Foundation import NSDate, NSPredicate
 
 from calsync.adapters.base import CalendarAdapter
 from calsync.models.event import CalendarEvent
 
 
+# Date conversions cross the PyObjC bridge and are called several times per
+# event. Boundary dates repeat constantly (midnights, recurring starts), so
+# cache them keyed by POSIX timestamp (NSDate itself is not reliably hashable).
+@lru_cache(maxsize=4096)
+def _datetime_from_timestamp(ts: float) -> datetime:
+    return datetime.fromtimestamp(ts)
+
+
+@lru_cache(maxsize=4096)
+def _nsdate_from_timestamp(ts: float) -> NSDate:
+    return NSDate.dateWithTimeIntervalSince1970_(ts)
+
+
 class EventKitAdapter(CalendarAdapter):
     """EventKit-based adapter for Apple Calendar on macOS."""
 
+    # How long a get_calendars result stays valid (seconds)
+    CALENDARS_CACHE_TTL = 60.0
+
     def __init__(self):
         self._store: Optional[EKEventStore] = None
         self._authorized: bool = False
+        # EKCalendar lookups cached per identifier for the adapter lifetime
+        self._calendar_cache: dict[str, object] = {}
+        self._calendars_cache: Optional[list[dict]] = None
+        self._calendars_cached_at: float = 0.0
 
     @property
     def store(self) -> EKEventStore:
@@ -34,7 +58,14 @@ class EventKitAdapter(CalendarAdapter):
         return self._store
 
     def _request_authorization(self) -> None:
-        """Request calendar access (blocking)."""
+        """Request calendar access (blocking on first grant)."""
+        # macOS caches the grant; skip the async handshake when we
+        # already have full access instead of blocking on the callback.
+        status = EKEventStore.authorizationStatusForEntityType_(EKEntityTypeEvent)
+        if status == EKAuthorizationStatusFullAccess:
+            self._authorized = True
+            return
+
         event = threading.Event()
         result = {"granted": False, "error": None}
 
@@ -54,31 +85,58 @@ class EventKitAdapter(CalendarAdapter):
 
     def _nsdate_from_datetime(self, dt: datetime) -> NSDate:
         """Convert Python datetime to NSDate."""
-        return NSDate.dateWithTimeIntervalSince1970_(dt.timestamp())
+        return _nsdate_from_timestamp(dt.timestamp())
 
     def _datetime_from_nsdate(self, nsdate: NSDate) -> datetime:
         """Convert NSDate to Python datetime."""
-        return datetime.fromtimestamp(nsdate.timeIntervalSince1970())
-
-    def _event_to_model(self, ek_event: EKEvent) -> CalendarEvent:
-        """Convert EKEvent to CalendarEvent model."""
-        return CalendarEvent(
-            id=ek_event.eventIdentifier(),
-            calendar_id=ek_event.calendar().calendarIdentifier(),
-            title=ek_event.title() or "",
-            start_date=self._datetime_from_nsdate(ek_event.startDate()),
-            end_date=self._datetime_from_nsdate(ek_event.endDate()),
-            is_all_day=ek_event.isAllDay(),
-            notes=ek_event.notes(),
-            location=ek_event.location(),
-            availability=ek_event.availability(),
-            self_participant_status=ek_event.selfParticipantStatus(),
+        return _datetime_from_timestamp(nsdate.timeIntervalSince1970())
+
+    def _calendar_with_id(self, calendar_id: str):
+        """Look up an EKCalendar by identifier, cached."""
+        calendar = self._calendar_cache.get(calendar_id)
+        if calendar is None:
+            calendar = self.store.calendarWithIdentifier_(calendar_id)
+            if calendar:
+                self._calendar_cache[calendar_id] = calendar
+        return calendar
+
+    def _event_to_model(
+        self, ek_event: EKEvent, calendar_id: Optional[str] = None
+    ) -> CalendarEvent:
+        """Convert EKEvent to CalendarEvent model.
+
+        Pass calendar_id when the caller already knows it to skip the
+        calendar().calendarIdentifier() bridge round-trip.
+        """
+        if calendar_id is None:
+            calendar_id = ek_event.calendar().calendarIdentifier()
+        # Intern: thousands of events share a handful of calendar IDs
+        # (str() first, interning rejects the NSString-backed subclass)
+        calendar_id = sys.intern(str(calendar_id))
+        return CalendarEvent._fast_new(
+            ek_event.eventIdentifier(),
+            calendar_id,
+            ek_event.title() or "",
+            self._datetime_from_nsdate(ek_event.startDate()),
+            self._datetime_from_nsdate(ek_event.endDate()),
+            ek_event.isAllDay(),
+            ek_event.notes(),
+            ek_event.location(),
+            ek_event.availability(),
+            ek_event.selfParticipantStatus(),
         )
 
     def get_calendars(self) -> list[dict]:
-        """List all calendars."""
+        """List all calendars (cached for a short TTL)."""
+        now = time.monotonic()
+        if (
+            self._calendars_cache is not None
+            and now - self._calendars_cached_at < self.CALENDARS_CACHE_TTL
+        ):
+            return self._calendars_cache
+
         calendars = self.store.calendarsForEntityType_(EKEntityTypeEvent)
-        return [
+        result = [
             {
                 "id": cal.calendarIdentifier(),
                 "name": cal.title(),
@@ -87,15 +145,23 @@ class EventKitAdapter(CalendarAdapter):
             }
             for cal in calendars
         ]
+        self._calendars_cache = result
+        self._calendars_cached_at = now
+        return result
 
     def get_events(
         self,
         calendar_id: str,
         start_date: datetime,
         end_date: datetime,
+        title_prefix: Optional[str] = None,
     ) -> list[CalendarEvent]:
-        """Get events from a calendar within a time range."""
-        calendar = self.store.calendarWithIdentifier_(calendar_id)
+        """Get events from a calendar within a time range.
+
+        With title_prefix, non-matching events are filtered out at the
+        Foundation layer before they ever cross the bridge.
+        """
+        calendar = self._calendar_with_id(calendar_id)
         if not calendar:
             raise ValueError(f"Calendar not found: {calendar_id}")
 
@@ -106,8 +172,69 @@ class EventKitAdapter(CalendarAdapter):
             ns_start, ns_end, [calendar]
         )
 
-        ek_events = self.store.eventsMatchingPredicate_(predicate)
-        return [self._event_to_model(ev) for ev in (ek_events or [])]
+        # All events of a single-calendar predicate share calendar_id,
+        # so skip the per-event calendar().calendarIdentifier() hops.
+        to_model = self._event_to_model
+
+        if title_prefix is not None:
+            # EventKit only enumerates its own date-range predicates, so
+            # the title filter is applied on the NSArray instead; only
+            # the surviving events are converted to Python models.
+            ek_events = self.store.eventsMatchingPredicate_(predicate)
+            if ek_events is None:
+                return []
+            title_predicate = NSPredicate.predicateWithFormat_argumentArray_(
+                "title BEGINSWITH %@", [title_prefix]
+            )
+            ek_events = ek_events.filteredArrayUsingPredicate_(title_predicate)
+            return [to_model(ev, calendar_id) for ev in ek_events]
+
+        # Block enumeration streams matches instead of building the
+        # intermediate NSArray that eventsMatchingPredicate_ returns.
+        events: list[CalendarEvent] = []
+
+        def collect(ek_event, stop):
+            events.append(to_model(ek_event, calendar_id))
+
+        self.store.enumerateEventsMatchingPredicate_usingBlock_(predicate, collect)
+        return events
+
+    def get_events_multi(
+        self,
+        calendar_ids: list[str],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> dict[str, list[CalendarEvent]]:
+        """Get events from multiple calendars with a single query.
+
+        EventKit predicates accept a calendar list, so one
+        eventsMatchingPredicate_ call replaces N per-calendar queries.
+        """
+        calendars = []
+        for calendar_id in calendar_ids:
+            calendar = self._calendar_with_id(calendar_id)
+            if not calendar:
+                raise ValueError(f"Calendar not found: {calendar_id}")
+            calendars.append(calendar)
+
+        ns_start = self._nsdate_from_datetime(start_date)
+        ns_end = self._nsdate_from_datetime(end_date)
+
+        predicate = self.store.predicateForEventsWithStartDate_endDate_calendars_(
+            ns_start, ns_end, calendars
+        )
+
+        events_by_calendar: dict[str, list[CalendarEvent]] = {
+            calendar_id: [] for calendar_id in calendar_ids
+        }
+        to_model = self._event_to_model
+
+        def collect(ek_event, stop):
+            event = to_model(ek_event)
+            events_by_calendar.setdefault(event.calendar_id, []).append(event)
+
+        self.store.enumerateEventsMatchingPredicate_usingBlock_(predicate, collect)
+        return events_by_calendar
 
     def get_event_by_id(self, event_id: str) -> Optional[CalendarEvent]:
         """Get a single event by ID."""
@@ -116,7 +243,7 @@ class EventKitAdapter(CalendarAdapter):
             return self._event_to_model(ek_event)
         return None
 
-    def create_event(
+    def _build_event(
         self,
         calendar_id: str,
         title: str,
@@ -125,9 +252,9 @@ class EventKitAdapter(CalendarAdapter):
         is_all_day: bool = False,
         notes: Optional[str] = None,
         availability: Optional[int] = None,
-    ) -> CalendarEvent:
-        """Create a new event."""
-        calendar = self.store.calendarWithIdentifier_(calendar_id)
+    ) -> EKEvent:
+        """Build an unsaved EKEvent."""
+        calendar = self._calendar_with_id(calendar_id)
         if not calendar:
             raise ValueError(f"Calendar not found: {calendar_id}")
 
@@ -148,6 +275,29 @@ class EventKitAdapter(CalendarAdapter):
         if availability is not None:
             event.setAvailability_(availability)
 
+        return event
+
+    def create_event(
+        self,
+        calendar_id: str,
+        title: str,
+        start_date: datetime,
+        end_date: datetime,
+        is_all_day: bool = False,
+        notes: Optional[str] = None,
+        availability: Optional[int] = None,
+    ) -> CalendarEvent:
+        """Create a new event."""
+        event = self._build_event(
+            calendar_id=calendar_id,
+            title=title,
+            start_date=start_date,
+            end_date=end_date,
+            is_all_day=is_all_day,
+            notes=notes,
+            availability=availability,
+        )
+
         success, error = self.store.saveEvent_span_error_(
             event, EKSpanThisEvent, None
         )
@@ -155,9 +305,37 @@ class EventKitAdapter(CalendarAdapter):
         if not success:
             raise RuntimeError(f"Failed to create event: {error}")
 
-        return self._event_to_model(event)
+        return self._event_to_model(event, calendar_id)
 
-    def update_event(
+    def create_events_batch(self, specs: list[dict]) -> list[CalendarEvent]:
+        """Create multiple events with a single store commit.
+
+        Saves each event with commit:NO and commits once at the end, so
+        EventKit runs one transaction instead of one per event.
+        """
+        events = [self._build_event(**spec) for spec in specs]
+
+        for event in events:
+            success, error = self.store.saveEvent_span_commit_error_(
+                event, EKSpanThisEvent, False, None
+            )
+            if not success:
+                # Drop the already-queued saves so a later commit on the
+                # shared store doesn't silently apply the half-batch
+                self.store.reset()
+                raise RuntimeError(f"Failed to create event: {error}")
+
+        success, error = self.store.commit_(None)
+        if not success:
+            self.store.reset()
+            raise RuntimeError(f"Failed to commit events: {error}")
+
+        return [
+            self._event_to_model(event, spec["calendar_id"])
+            for event, spec in zip(events, specs)
+        ]
+
+    def _apply_update(
         self,
         event_id: str,
         title: Optional[str] = None,
@@ -165,8 +343,8 @@ class EventKitAdapter(CalendarAdapter):
         end_date: Optional[datetime] = None,
         notes: Optional[str] = None,
         availability: Optional[int] = None,
-    ) -> CalendarEvent:
-        """Update an existing event."""
+    ) -> EKEvent:
+        """Fetch an EKEvent and apply field changes without saving."""
         ek_event = self.store.eventWithIdentifier_(event_id)
         if not ek_event:
             raise ValueError(f"Event not found: {event_id}")
@@ -182,6 +360,27 @@ class EventKitAdapter(CalendarAdapter):
         if availability is not None:
             ek_event.setAvailability_(availability)
 
+        return ek_event
+
+    def update_event(
+        self,
+        event_id: str,
+        title: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        notes: Optional[str] = None,
+        availability: Optional[int] = None,
+    ) -> CalendarEvent:
+        """Update an existing event."""
+        ek_event = self._apply_update(
+            event_id,
+            title=title,
+            start_date=start_date,
+            end_date=end_date,
+            notes=notes,
+            availability=availability,
+        )
+
         success, error = self.store.saveEvent_span_error_(
             ek_event, EKSpanThisEvent, None
         )
@@ -191,6 +390,28 @@ class EventKitAdapter(CalendarAdapter):
 
         return self._event_to_model(ek_event)
 
+    def update_events_batch(self, updates: list[dict]) -> list[CalendarEvent]:
+        """Update multiple events with a single store commit."""
+        ek_events = []
+        for update in updates:
+            ek_event = self._apply_update(**update)
+            success, error = self.store.saveEvent_span_commit_error_(
+                ek_event, EKSpanThisEvent, False, None
+            )
+            if not success:
+                # Drop the already-queued saves so a later commit on the
+                # shared store doesn't silently apply the half-batch
+                self.store.reset()
+                raise RuntimeError(f"Failed to update event: {error}")
+            ek_events.append(ek_event)
+
+        success, error = self.store.commit_(None)
+        if not success:
+            self.store.reset()
+            raise RuntimeError(f"Failed to commit events: {error}")
+
+        return [self._event_to_model(ek_event) for ek_event in ek_events]
+
     def delete_event(self, event_id: str) -> bool:
         """Delete an event."""
         ek_event = self.store.eventWithIdentifier_(event_id)
@@ -202,3 +423,26 @@ class EventKitAdapter(CalendarAdapter):
         )
 
         return success
+
+    def delete_events_batch(self, event_ids: list[str]) -> int:
+        """Delete multiple events with a single store commit."""
+        deleted = 0
+        for event_id in event_ids:
+            ek_event = self.store.eventWithIdentifier_(event_id)
+            if not ek_event:
+                continue
+            success, error = self.store.removeEvent_span_commit_error_(
+                ek_event, EKSpanThisEvent, False, None
+            )
+            if success:
+                deleted += 1
+
+        if deleted:
+            success, error = self.store.commit_(None)
+            if not success:
+                # Drop the queued removals so a later commit on the
+                # shared store doesn't silently apply them
+                self.store.reset()
+                raise RuntimeError(f"Failed to commit deletions: {error}")
+
+        return deleted
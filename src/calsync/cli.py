@@ -1,13 +1,14 @@
 """CLI interface for CalSync."""
 
 import logging
-from datetime import datetime, timedelta
+from datetime import date, datetime, time, timedelta
 from typing import Optional
 
 import click
 
-from calsync.adapters.eventkit import EventKitAdapter
+from calsync.adapters import get_adapter
 from calsync.config import CalendarConfig, Config
+from calsync.sync.engine import SyncEngine
 
 
 @click.group()
@@ -21,26 +22,27 @@ def cli(ctx: click.Context, verbose: bool, quiet: bool, profile: Optional[str])
     ctx.obj["profile"] = profile
     ctx.obj["quiet"] = quiet
 
-    level = logging.DEBUG if verbose else (logging.WARNING if quiet else logging.INFO)
-    logging.basicConfig(
-        level=level,
-        format="%(levelname)s: %(message)s",
+    # Handler installation is deferred to commands that actually log
+    # (sync); the listing commands only use click.echo.
+    ctx.obj["log_level"] = (
+        logging.DEBUG if verbose else (logging.WARNING if quiet else logging.INFO)
     )
 
 
 @cli.command("list-calendars")
 def list_calendars() -> None:
     """List all available calendars."""
-    adapter = EventKitAdapter()
+    adapter = get_adapter()
     calendars = adapter.get_calendars()
 
-    click.echo("\nAvailable calendars:\n")
+    lines = ["", "Available calendars:", ""]
     for cal in calendars:
         writable = "rw" if cal["writable"] else "ro"
-        click.echo(f"  [{writable}] {cal['name']}")
-        click.echo(f"       ID: {cal['id']}")
-        click.echo(f"       Source: {cal['source']}")
-        click.echo()
+        lines.append(f"  [{writable}] {cal['name']}")
+        lines.append(f"       ID: {cal['id']}")
+        lines.append(f"       Source: {cal['source']}")
+        lines.append("")
+    click.echo("\n".join(lines))
 
 
 @cli.command()
@@ -48,7 +50,7 @@ def list_calendars() -> None:
 def configure(ctx: click.Context) -> None:
     """Configure the calendars to sync."""
     profile = ctx.obj.get("profile")
-    adapter = EventKitAdapter()
+    adapter = get_adapter()
     calendars = adapter.get_calendars()
 
     # Only show writable calendars
@@ -58,31 +60,36 @@ def configure(ctx: click.Context) -> None:
         click.echo("Error: Need at least 2 writable calendars.")
         return
 
-    click.echo("\nWritable calendars:\n")
+    lines = ["", "Writable calendars:", ""]
     for i, cal in enumerate(writable, 1):
-        click.echo(f"  {i}. {cal['name']} ({cal['source']})")
-
-    click.echo("\nEnter calendar numbers to sync (comma-separated, e.g. '1,2,3'):")
+        lines.append(f"  {i}. {cal['name']} ({cal['source']})")
+    lines.append("")
+    lines.append("Enter calendar numbers to sync (comma-separated, e.g. '1,2,3'):")
+    click.echo("\n".join(lines))
     selection = click.prompt("Calendars", type=str)
 
-    try:
-        indices = [int(x.strip()) - 1 for x in selection.split(",")]
-    except ValueError:
-        click.echo("Error: Invalid input. Use comma-separated numbers.")
-        return
+    # Parse and validate in a single pass over the input
+    indices: list[int] = []
+    seen: set[int] = set()
+    for token in selection.split(","):
+        try:
+            index = int(token.strip()) - 1
+        except ValueError:
+            click.echo("Error: Invalid input. Use comma-separated numbers.")
+            return
+        if index in seen:
+            click.echo("Error: Duplicate selections not allowed.")
+            return
+        if not 0 <= index < len(writable):
+            click.echo("Error: Invalid calendar number.")
+            return
+        seen.add(index)
+        indices.append(index)
 
     if len(indices) < 2:
         click.echo("Error: Select at least 2 calendars.")
         return
 
-    if len(indices) != len(set(indices)):
-        click.echo("Error: Duplicate selections not allowed.")
-        return
-
-    if not all(0 <= i < len(writable) for i in indices):
-        click.echo("Error: Invalid calendar number.")
-        return
-
     selected = [
         CalendarConfig(id=writable[i]["id"], name=writable[i]["name"])
         for i in indices
@@ -92,9 +99,10 @@ def configure(ctx: click.Context) -> None:
     config.save()
 
     profile_info = f" (profile: {profile})" if profile else ""
-    click.echo(f"\nConfiguration saved{profile_info} ({len(selected)} calendars):")
+    lines = [f"\nConfiguration saved{profile_info} ({len(selected)} calendars):"]
     for i, cal in enumerate(selected, 1):
-        click.echo(f"  {i}. {cal.name}")
+        lines.append(f"  {i}. {cal.name}")
+    click.echo("\n".join(lines))
 
 
 @cli.command()
@@ -105,6 +113,10 @@ def sync(ctx: click.Context, days: int, dry_run: bool) -> None:
     """Sync placeholders between configured calendars."""
     profile = ctx.obj.get("profile")
     quiet = ctx.obj.get("quiet", False)
+    logging.basicConfig(
+        level=ctx.obj["log_level"],
+        format="%(levelname)s: %(message)s",
+    )
     config = Config.load(profile)
 
     if not config.is_configured():
@@ -112,9 +124,7 @@ def sync(ctx: click.Context, days: int, dry_run: bool) -> None:
         click.echo(f"Error: Calendars not configured{profile_hint}. Run 'calsync configure' first.")
         return
 
-    from calsync.sync.engine import SyncEngine
-
-    adapter = EventKitAdapter()
+    adapter = get_adapter()
     engine = SyncEngine(
         adapter=adapter,
         calendar_ids=config.get_calendar_ids(),
@@ -122,7 +132,7 @@ def sync(ctx: click.Context, days: int, dry_run: bool) -> None:
 
     # Ende: Mitternacht in `days` Tagen (lokale Zeitzone)
     # -d 1 = heute bis Tagesende, -d 2 = bis morgen Tagesende, etc.
-    today_midnight = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    today_midnight = datetime.combine(date.today(), time.min)
     end_date = today_midnight + timedelta(days=days)
 
     if dry_run and not quiet:
@@ -183,9 +193,10 @@ def status(ctx: click.Context) -> None:
         return
 
     profile_info = f" [profile: {profile}]" if profile else ""
-    click.echo(f"\nConfigured calendars ({len(config.calendars)}){profile_info}:\n")
+    lines = ["", f"Configured calendars ({len(config.calendars)}){profile_info}:", ""]
     for i, cal in enumerate(config.calendars, 1):
-        click.echo(f"  {i}. {cal.name}")
+        lines.append(f"  {i}. {cal.name}")
+    click.echo("\n".join(lines))
 
 
 if __name__ == "__main__":
@@ -1,21 +1,60 @@
 """Configuration management for CalSync."""
 
 import json
+import os
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-CONFIG_DIR = Path.cwd()
-
 
 def get_config_file(profile: Optional[str] = None) -> Path:
-    """Get config file path for a profile."""
+    """Get config file path for a profile.
+
+    Resolved against the current working directory at call time, so the
+    path follows os.chdir instead of freezing at import.
+    """
     if profile:
-        return CONFIG_DIR / f".calsync-{profile}.json"
-    return CONFIG_DIR / ".calsync.json"
+        return Path.cwd() / f".calsync-{profile}.json"
+    return Path.cwd() / ".calsync.json"
+
+
+@lru_cache(maxsize=32)
+def _load_cached(
+    config_file: Path, mtime_ns: int, profile: Optional[str]
+) -> "Config":
+    """Parse a config file, cached per (path, mtime).
+
+    A changed mtime misses the cache, so edits are picked up; the LRU
+    bound keeps stale entries from accumulating across profiles.
+    """
+    data = json.loads(config_file.read_bytes())
+
+    # Handle legacy format (calendar_a_id, calendar_b_id)
+    if "calendar_a_id" in data:
+        calendars = []
+        if data.get("calendar_a_id"):
+            calendars.append(
+                CalendarConfig(
+                    id=data["calendar_a_id"],
+                    name=data.get("calendar_a_name", "Calendar A"),
+                )
+            )
+        if data.get("calendar_b_id"):
+            calendars.append(
+                CalendarConfig(
+                    id=data["calendar_b_id"],
+                    name=data.get("calendar_b_name", "Calendar B"),
+                )
+            )
+    else:
+        # New format
+        calendars = [CalendarConfig(**c) for c in data.get("calendars", [])]
 
+    return Config(calendars=calendars, profile=profile)
 
-@dataclass
+
+@dataclass(slots=True)
 class CalendarConfig:
     """Configuration for a single calendar."""
 
@@ -23,12 +62,16 @@ class CalendarConfig:
     name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Application configuration."""
 
     calendars: list[CalendarConfig] = field(default_factory=list)
     profile: Optional[str] = None
+    _by_id: dict[str, str] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._by_id = {c.id: c.name for c in self.calendars}
 
     @classmethod
     def load(cls, profile: Optional[str] = None) -> "Config":
@@ -37,41 +80,21 @@ class Config:
         if not config_file.exists():
             return cls(profile=profile)
 
-        with open(config_file) as f:
-            data = json.load(f)
-
-        # Handle legacy format (calendar_a_id, calendar_b_id)
-        if "calendar_a_id" in data:
-            calendars = []
-            if data.get("calendar_a_id"):
-                calendars.append(
-                    CalendarConfig(
-                        id=data["calendar_a_id"],
-                        name=data.get("calendar_a_name", "Calendar A"),
-                    )
-                )
-            if data.get("calendar_b_id"):
-                calendars.append(
-                    CalendarConfig(
-                        id=data["calendar_b_id"],
-                        name=data.get("calendar_b_name", "Calendar B"),
-                    )
-                )
-            return cls(calendars=calendars, profile=profile)
-
-        # New format
-        calendars = [CalendarConfig(**c) for c in data.get("calendars", [])]
-        return cls(calendars=calendars, profile=profile)
+        return _load_cached(config_file, config_file.stat().st_mtime_ns, profile)
 
     def save(self) -> None:
-        """Save configuration to file."""
+        """Save configuration to file (atomically)."""
         config_file = get_config_file(self.profile)
-        with open(config_file, "w") as f:
+        # Write to a sibling temp file and rename, so a crash mid-write
+        # never leaves a truncated config behind
+        tmp_file = config_file.with_name(config_file.name + ".tmp")
+        with open(tmp_file, "w") as f:
             json.dump(
                 {"calendars": [{"id": c.id, "name": c.name} for c in self.calendars]},
                 f,
                 indent=2,
             )
+        os.replace(tmp_file, config_file)
 
     def is_configured(self) -> bool:
         """Check if at least two calendars are configured."""
@@ -83,7 +106,4 @@ class Config:
 
     def get_calendar_name(self, calendar_id: str) -> str:
         """Get calendar name by ID."""
-        for c in self.calendars:
-            if c.id == calendar_id:
-                return c.name
-        return calendar_id[:8]
+        return self._by_id.get(calendar_id, calendar_id[:8])
@@ -1,11 +1,13 @@
 """Calendar event data model."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
+from calsync.models.placeholder import PlaceholderInfo
 
-@dataclass
+
+@dataclass(slots=True)
 class CalendarEvent:
     """Represents a calendar event."""
 
@@ -21,6 +23,84 @@ class CalendarEvent:
     availability: Optional[int] = None
     # EventKit self participant status: 1=Pending, 2=Accepted, 3=Declined, 4=Tentative
     self_participant_status: Optional[int] = None
+    # Tracking state derived from notes, lazily cached by EventTracker
+    _is_placeholder: Optional[bool] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _tracking_info: Optional[PlaceholderInfo] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _tracking_parsed: bool = field(
+        default=False, init=False, repr=False, compare=False
+    )
+    # Sync-relevant fingerprint, lazily cached by EventTracker
+    _hash: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # ISO date strings, lazily cached (see iso_start/iso_end)
+    _iso_start: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _iso_end: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @classmethod
+    def _fast_new(
+        cls,
+        id: str,
+        calendar_id: str,
+        title: str,
+        start_date: datetime,
+        end_date: datetime,
+        is_all_day: bool,
+        notes: Optional[str],
+        location: Optional[str],
+        availability: Optional[int],
+        self_participant_status: Optional[int],
+    ) -> "CalendarEvent":
+        """Positional fast path for the adapter's conversion loop.
+
+        Skips the generated __init__'s keyword and default machinery by
+        assigning every slot directly; must stay in sync with the field
+        list above.
+        """
+        self = object.__new__(cls)
+        self.id = id
+        self.calendar_id = calendar_id
+        self.title = title
+        self.start_date = start_date
+        self.end_date = end_date
+        self.is_all_day = is_all_day
+        self.notes = notes
+        self.location = location
+        self.availability = availability
+        self.self_participant_status = self_participant_status
+        self._is_placeholder = None
+        self._tracking_info = None
+        self._tracking_parsed = False
+        self._hash = None
+        self._iso_start = None
+        self._iso_end = None
+        return self
+
+    @property
+    def iso_start(self) -> str:
+        """start_date.isoformat(), cached.
+
+        Occurrence keys, hashing and notes markers all want the same
+        string; the property formats it once per event.
+        """
+        if self._iso_start is None:
+            self._iso_start = self.start_date.isoformat()
+        return self._iso_start
+
+    @property
+    def iso_end(self) -> str:
+        """end_date.isoformat(), cached."""
+        if self._iso_end is None:
+            self._iso_end = self.end_date.isoformat()
+        return self._iso_end
 
     @property
     def duration_minutes(self) -> int:
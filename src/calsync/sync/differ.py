@@ -5,6 +5,7 @@ from enum import Enum
 from typing import Optional
 
 from calsync.models.event import CalendarEvent
+from calsync.models.placeholder import PlaceholderInfo
 from calsync.sync.tracker import EventTracker
 
 # EventKit participant status constants
@@ -26,7 +27,22 @@ class ChangeType(Enum):
     NOOP = "noop"
 
 
-@dataclass
+@dataclass(slots=True)
+class CalendarView:
+    """Precomputed per-calendar structures for diffing.
+
+    Built once per calendar and reused across every direction that
+    calendar participates in, instead of re-partitioning the raw event
+    list N-1 times.
+    """
+
+    # Syncable events paired with their occurrence keys
+    real: list[tuple[CalendarEvent, str]]
+    # Placeholder index: source calendar id -> occurrence key -> (event, info)
+    placeholders_by_source: dict[str, dict[str, tuple[CalendarEvent, PlaceholderInfo]]]
+
+
+@dataclass(slots=True)
 class SyncAction:
     """Describes a sync action to perform."""
 
@@ -34,6 +50,9 @@ class SyncAction:
     source_event: Optional[CalendarEvent]
     target_event: Optional[CalendarEvent]
     reason: str
+    # Carried over from diffing so the engine doesn't recompute them
+    source_hash: Optional[str] = None
+    placeholder_info: Optional[PlaceholderInfo] = None
 
 
 class ChangeDiffer:
@@ -68,18 +87,44 @@ class ChangeDiffer:
 
         return True
 
+    def build_view(self, events: list[CalendarEvent]) -> CalendarView:
+        """Partition a calendar's events into a reusable CalendarView.
+
+        One pass splits placeholders (indexed by origin calendar and
+        occurrence key, with the parsed tracking info kept alongside)
+        from syncable real events (paired with their occurrence keys).
+        """
+        real: list[tuple[CalendarEvent, str]] = []
+        placeholders_by_source: dict[
+            str, dict[str, tuple[CalendarEvent, PlaceholderInfo]]
+        ] = {}
+        for event in events:
+            # try_extract returns None for non-placeholders, so a
+            # separate is_placeholder pre-check would scan the notes
+            # twice for every actual placeholder
+            info = self.tracker.try_extract(event)
+            if info is not None:
+                placeholders_by_source.setdefault(info.source_calendar_id, {})[
+                    info.get_occurrence_key()
+                ] = (event, info)
+                continue
+            if not self._should_sync_event(event):
+                continue
+            real.append((event, self.tracker.get_occurrence_key(event)))
+        return CalendarView(real=real, placeholders_by_source=placeholders_by_source)
+
     def compute_sync_actions(
         self,
-        source_events: list[CalendarEvent],
-        target_events: list[CalendarEvent],
+        source_view: CalendarView,
+        target_view: CalendarView,
         source_calendar_id: str,
     ) -> list[SyncAction]:
         """
         Compute all necessary sync actions.
 
         Args:
-            source_events: Events from source calendar
-            target_events: Events from target calendar (including placeholders)
+            source_view: View of the source calendar
+            target_view: View of the target calendar (including placeholders)
             source_calendar_id: ID of the source calendar
 
         Returns:
@@ -87,36 +132,31 @@ class ChangeDiffer:
         """
         actions: list[SyncAction] = []
 
-        # Filter: Only syncable events (not placeholders, not pending/declined)
-        real_source_events = [
-            e for e in source_events if self._should_sync_event(e)
-        ]
-
-        # Find placeholders in target calendar that originated from source
-        # Use occurrence key (event_id + start_date) to handle recurring events
-        placeholders: dict[str, CalendarEvent] = {}
-        for event in target_events:
-            if self.tracker.is_placeholder(event):
-                info = self.tracker.extract_tracking_info(event)
-                if info and info.source_calendar_id == source_calendar_id:
-                    placeholders[info.get_occurrence_key()] = event
+        real_source_events = source_view.real
+        # Placeholders in the target calendar that originated from source;
+        # occurrence keys (event_id + start_date) handle recurring events
+        placeholders = target_view.placeholders_by_source.get(source_calendar_id, {})
 
         # 1. CREATE/UPDATE: Check each source event
-        for source in real_source_events:
-            occurrence_key = self.tracker.get_occurrence_key(source)
+        # Placeholders hit here are accounted for; whatever is left
+        # over afterwards has lost its source event
+        matched_keys: set[str] = set()
+        for source, occurrence_key in real_source_events:
             if occurrence_key in placeholders:
                 # Placeholder exists - check if update needed
-                placeholder = placeholders[occurrence_key]
-                info = self.tracker.extract_tracking_info(placeholder)
+                placeholder, info = placeholders[occurrence_key]
+                matched_keys.add(occurrence_key)
                 current_hash = self.tracker.compute_event_hash(source)
 
-                if info and info.source_hash != current_hash:
+                if info.source_hash != current_hash:
                     actions.append(
                         SyncAction(
                             action_type=ChangeType.UPDATE,
                             source_event=source,
                             target_event=placeholder,
                             reason=f"Event changed (hash: {info.source_hash[:8]} -> {current_hash[:8]})",
+                            source_hash=current_hash,
+                            placeholder_info=info,
                         )
                     )
             else:
@@ -127,13 +167,13 @@ class ChangeDiffer:
                         source_event=source,
                         target_event=None,
                         reason="New event, creating placeholder",
+                        source_hash=self.tracker.compute_event_hash(source),
                     )
                 )
 
         # 2. DELETE: Remove placeholders without source event
-        source_keys = {self.tracker.get_occurrence_key(e) for e in real_source_events}
-        for occurrence_key, placeholder in placeholders.items():
-            if occurrence_key not in source_keys:
+        for occurrence_key, (placeholder, _info) in placeholders.items():
+            if occurrence_key not in matched_keys:
                 actions.append(
                     SyncAction(
                         action_type=ChangeType.DELETE,
@@ -2,13 +2,15 @@
 
 import logging
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from functools import cached_property
+from datetime import date, datetime, time, timedelta
 from itertools import permutations
 
 from calsync.adapters.base import CalendarAdapter
 from calsync.models.event import CalendarEvent
 from calsync.models.placeholder import PlaceholderInfo
 from calsync.sync.differ import (
+    CalendarView,
     ChangeDiffer,
     ChangeType,
     PARTICIPANT_STATUS_TENTATIVE,
@@ -23,7 +25,7 @@ AVAILABILITY_UNAVAILABLE = 3  # Out of Office / Außer Haus
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncResult:
     """Result of a sync operation."""
 
@@ -39,25 +41,38 @@ class SyncResult:
         return self.created + self.updated + self.deleted
 
 
+# No slots=True here: cached_property needs the instance __dict__
 @dataclass
 class SyncSummary:
-    """Summary of all sync operations."""
+    """Summary of all sync operations.
+
+    Aggregates are cached after first access; append results via
+    add_result so the cache is invalidated.
+    """
 
     results: list[SyncResult] = field(default_factory=list)
 
-    @property
+    _AGGREGATES = ("total_created", "total_updated", "total_deleted", "all_errors")
+
+    def add_result(self, result: SyncResult) -> None:
+        """Append a result, invalidating any cached aggregates."""
+        self.results.append(result)
+        for name in self._AGGREGATES:
+            vars(self).pop(name, None)
+
+    @cached_property
     def total_created(self) -> int:
         return sum(r.created for r in self.results)
 
-    @property
+    @cached_property
     def total_updated(self) -> int:
         return sum(r.updated for r in self.results)
 
-    @property
+    @cached_property
     def total_deleted(self) -> int:
         return sum(r.deleted for r in self.results)
 
-    @property
+    @cached_property
     def all_errors(self) -> list[str]:
         return [e for r in self.results for e in r.errors]
 
@@ -115,26 +130,55 @@ class SyncEngine:
             SyncSummary with results for each direction
         """
         if start_date is None:
-            start_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+            start_date = datetime.combine(date.today(), time.min)
         if end_date is None:
             end_date = start_date + timedelta(days=30)
 
-        logger.info(f"Sync period: {start_date.date()} to {end_date.date()}")
-        logger.info(f"Calendars: {len(self.calendar_ids)}")
+        logger.info("Sync period: %s to %s", start_date.date(), end_date.date())
+        logger.info("Calendars: %d", len(self.calendar_ids))
 
         summary = SyncSummary()
 
-        # Load events from all calendars
-        events_by_calendar: dict[str, list[CalendarEvent]] = {}
-        for cal_id in self.calendar_ids:
-            events = self.adapter.get_events(cal_id, start_date, end_date)
-            events_by_calendar[cal_id] = events
-            logger.info(f"Calendar {cal_id[:8]}...: {len(events)} events")
+        # Load events from all calendars with a single query
+        events_by_calendar: dict[str, list[CalendarEvent]] = self.adapter.get_events_multi(
+            self.calendar_ids, start_date, end_date
+        )
+        for cal_id, events in events_by_calendar.items():
+            logger.info("Calendar %s...: %d events", cal_id[:8], len(events))
+
+        # An empty window means there is nothing to create, update or
+        # delete in any direction
+        if not any(events_by_calendar.values()):
+            logger.info("No events in sync period, nothing to do")
+            return summary
+
+        # Partition each calendar once; every direction a calendar takes
+        # part in reuses the same view instead of rescanning its events
+        views: dict[str, CalendarView] = {
+            cal_id: self.differ.build_view(events)
+            for cal_id, events in events_by_calendar.items()
+        }
 
         # Sync each pair (source -> target)
         for source_id, target_id in permutations(self.calendar_ids, 2):
+            source_view = views[source_id]
+            target_view = views[target_id]
+            # A direction only acts when the source has real events or
+            # the target still holds placeholders from this source
+            # (those would need deleting even with an empty source)
+            if (
+                not source_view.real
+                and source_id not in target_view.placeholders_by_source
+            ):
+                logger.debug(
+                    "Skipping %s... -> %s...: nothing to sync",
+                    source_id[:8],
+                    target_id[:8],
+                )
+                continue
             result = self._sync_direction(
-                source_events=events_by_calendar[source_id],
+                source_view=source_view,
+                target_view=target_view,
                 target_events=events_by_calendar[target_id],
                 source_cal_id=source_id,
                 target_cal_id=target_id,
@@ -142,19 +186,20 @@ class SyncEngine:
             )
             result.source_id = source_id
             result.target_id = target_id
-            summary.results.append(result)
+            summary.add_result(result)
 
-            # Refresh target events if changes were made
+            # Only a mutated target's view goes stale
             if not dry_run and result.total_actions > 0:
-                events_by_calendar[target_id] = self.adapter.get_events(
-                    target_id, start_date, end_date
+                views[target_id] = self.differ.build_view(
+                    events_by_calendar[target_id]
                 )
 
         return summary
 
     def _sync_direction(
         self,
-        source_events: list[CalendarEvent],
+        source_view: CalendarView,
+        target_view: CalendarView,
         target_events: list[CalendarEvent],
         source_cal_id: str,
         target_cal_id: str,
@@ -164,102 +209,170 @@ class SyncEngine:
         result = SyncResult()
 
         actions = self.differ.compute_sync_actions(
-            source_events, target_events, source_cal_id
+            source_view, target_view, source_cal_id
         )
 
         logger.debug(
-            f"Direction {source_cal_id[:8]}... -> {target_cal_id[:8]}...: {len(actions)} actions"
+            "Direction %s... -> %s...: %d actions",
+            source_cal_id[:8],
+            target_cal_id[:8],
+            len(actions),
         )
 
+        create_specs: list[dict] = []
+        update_specs: list[dict] = []
+        delete_ids: list[str] = []
+
         for action in actions:
             try:
                 if action.action_type == ChangeType.CREATE:
                     if not dry_run:
-                        self._create_placeholder(
-                            action.source_event,
-                            source_cal_id,
-                            target_cal_id,
+                        create_specs.append(
+                            self._placeholder_spec(
+                                action.source_event,
+                                source_cal_id,
+                                target_cal_id,
+                                source_hash=action.source_hash,
+                            )
                         )
-                    result.created += 1
-                    logger.debug(f"CREATE: {action.reason}")
+                    else:
+                        result.created += 1
+                    logger.debug("CREATE: %s", action.reason)
 
                 elif action.action_type == ChangeType.UPDATE:
                     if not dry_run:
-                        self._update_placeholder(
-                            action.source_event,
-                            action.target_event,
-                            source_cal_id,
+                        update_specs.append(
+                            self._update_spec(
+                                action.source_event,
+                                action.target_event,
+                                source_cal_id,
+                                source_hash=action.source_hash,
+                                info=action.placeholder_info,
+                            )
                         )
-                    result.updated += 1
-                    logger.debug(f"UPDATE: {action.reason}")
+                    else:
+                        result.updated += 1
+                    logger.debug("UPDATE: %s", action.reason)
 
                 elif action.action_type == ChangeType.DELETE:
                     if not dry_run:
-                        self.adapter.delete_event(action.target_event.id)
-                    result.deleted += 1
-                    logger.debug(f"DELETE: {action.reason}")
+                        delete_ids.append(action.target_event.id)
+                    else:
+                        result.deleted += 1
+                    logger.debug("DELETE: %s", action.reason)
 
             except Exception as e:
                 error_msg = f"Error in {action.action_type.value}: {e}"
                 logger.error(error_msg)
                 result.errors.append(error_msg)
 
+        # Flush each action type for this direction in a single commit
+        created: list[CalendarEvent] = []
+        updated: list[CalendarEvent] = []
+        deleted_ids: set[str] = set()
+
+        if create_specs:
+            try:
+                created = self.adapter.create_events_batch(create_specs)
+                result.created += len(created)
+            except Exception as e:
+                error_msg = f"Error in create: {e}"
+                logger.error(error_msg)
+                result.errors.append(error_msg)
+
+        if update_specs:
+            try:
+                updated = self.adapter.update_events_batch(update_specs)
+                result.updated += len(updated)
+            except Exception as e:
+                error_msg = f"Error in update: {e}"
+                logger.error(error_msg)
+                result.errors.append(error_msg)
+
+        if delete_ids:
+            try:
+                result.deleted += self.adapter.delete_events_batch(delete_ids)
+                deleted_ids = set(delete_ids)
+            except Exception as e:
+                error_msg = f"Error in delete: {e}"
+                logger.error(error_msg)
+                result.errors.append(error_msg)
+
+        # Apply the changes to the in-memory target list, so later
+        # directions see them without re-fetching the whole calendar
+        if updated:
+            updated_by_id = {e.id: e for e in updated}
+            for i, event in enumerate(target_events):
+                replacement = updated_by_id.get(event.id)
+                if replacement is not None:
+                    target_events[i] = replacement
+        if deleted_ids:
+            target_events[:] = [e for e in target_events if e.id not in deleted_ids]
+        if created:
+            target_events.extend(created)
+
         return result
 
-    def _create_placeholder(
+    def _placeholder_spec(
         self,
         source_event: CalendarEvent,
         source_cal_id: str,
         target_cal_id: str,
-    ) -> None:
-        """Create a placeholder for a source event."""
+        source_hash: str | None = None,
+    ) -> dict:
+        """Build the create_event spec for a placeholder."""
         tracking_id = PlaceholderInfo.generate_tracking_id()
-        source_hash = self.tracker.compute_event_hash(source_event)
+        if source_hash is None:
+            source_hash = self.tracker.compute_event_hash(source_event)
 
         notes = self.tracker.create_placeholder_notes(
             tracking_id=tracking_id,
             source_event_id=source_event.id,
             source_calendar_id=source_cal_id,
             source_hash=source_hash,
-            source_start=source_event.start_date.isoformat(),
+            source_start=source_event.iso_start,
         )
 
         availability = self._get_placeholder_availability(source_event)
 
-        self.adapter.create_event(
-            calendar_id=target_cal_id,
-            title=self.PLACEHOLDER_TITLE,
-            start_date=source_event.start_date,
-            end_date=source_event.end_date,
-            is_all_day=source_event.is_all_day,
-            notes=notes,
-            availability=availability,
-        )
-
-    def _update_placeholder(
+        return {
+            "calendar_id": target_cal_id,
+            "title": self.PLACEHOLDER_TITLE,
+            "start_date": source_event.start_date,
+            "end_date": source_event.end_date,
+            "is_all_day": source_event.is_all_day,
+            "notes": notes,
+            "availability": availability,
+        }
+
+    def _update_spec(
         self,
         source_event: CalendarEvent,
         placeholder_event: CalendarEvent,
         source_cal_id: str,
-    ) -> None:
-        """Update an existing placeholder."""
-        info = self.tracker.extract_tracking_info(placeholder_event)
-        source_hash = self.tracker.compute_event_hash(source_event)
+        source_hash: str | None = None,
+        info: PlaceholderInfo | None = None,
+    ) -> dict:
+        """Build the update_event spec for an existing placeholder."""
+        if info is None:
+            info = self.tracker.try_extract(placeholder_event)
+        if source_hash is None:
+            source_hash = self.tracker.compute_event_hash(source_event)
 
         notes = self.tracker.create_placeholder_notes(
             tracking_id=info.tracking_id,
             source_event_id=source_event.id,
             source_calendar_id=source_cal_id,
             source_hash=source_hash,
-            source_start=source_event.start_date.isoformat(),
+            source_start=source_event.iso_start,
         )
 
         availability = self._get_placeholder_availability(source_event)
 
-        self.adapter.update_event(
-            event_id=placeholder_event.id,
-            start_date=source_event.start_date,
-            end_date=source_event.end_date,
-            notes=notes,
-            availability=availability,
-        )
+        return {
+            "event_id": placeholder_event.id,
+            "start_date": source_event.start_date,
+            "end_date": source_event.end_date,
+            "notes": notes,
+            "availability": availability,
+        }
@@ -1,7 +1,6 @@
 """Event tracking and hash computation."""
 
 import hashlib
-import json
 
 from calsync.models.event import CalendarEvent
 from calsync.models.placeholder import PlaceholderInfo, TRACKING_PREFIX
@@ -15,32 +14,54 @@ class EventTracker:
         """
         Compute a hash based on sync-relevant attributes.
         Used to detect changes in source events.
+
+        Cached on the event: with N calendars the same source event is
+        hashed once instead of once per target direction.
         """
-        data = {
-            "start": event.start_date.isoformat(),
-            "end": event.end_date.isoformat(),
-            "all_day": event.is_all_day,
-            "participant_status": event.self_participant_status,
-            "availability": event.availability,
-        }
-        return hashlib.sha256(
-            json.dumps(data, sort_keys=True).encode()
-        ).hexdigest()[:16]
+        if event._hash is not None:
+            return event._hash
+        # Fixed field order, so no dict/JSON round-trip is needed;
+        # "|" cannot appear in any of the joined values
+        payload = (
+            f"{event.iso_start}|{event.iso_end}"
+            f"|{event.is_all_day}|{event.self_participant_status}"
+            f"|{event.availability}"
+        ).encode()
+        # blake2b with an 8-byte digest gives the same 16-hex-char
+        # marker format as the truncated sha256 it replaces, faster
+        event._hash = hashlib.blake2b(payload, digest_size=8).hexdigest()
+        return event._hash
 
     @staticmethod
     def is_placeholder(event: CalendarEvent) -> bool:
-        """Check if an event is a sync placeholder."""
-        return event.notes is not None and TRACKING_PREFIX in event.notes
+        """Check if an event is a sync placeholder (cached on the event)."""
+        if event._is_placeholder is None:
+            event._is_placeholder = (
+                event.notes is not None and TRACKING_PREFIX in event.notes
+            )
+        return event._is_placeholder
+
+    @staticmethod
+    def try_extract(event: CalendarEvent) -> PlaceholderInfo | None:
+        """Parse and cache an event's tracking info, None for non-placeholders.
+
+        The single scan replaces paired is_placeholder + extract calls:
+        callers branch on the returned info directly.
+        """
+        if not event._tracking_parsed:
+            event._tracking_info = PlaceholderInfo.from_notes(event.notes)
+            event._tracking_parsed = True
+        return event._tracking_info
 
     @staticmethod
     def extract_tracking_info(event: CalendarEvent) -> PlaceholderInfo | None:
-        """Extract tracking info from a placeholder event."""
-        return PlaceholderInfo.from_notes(event.notes)
+        """Extract tracking info from a placeholder event (cached on the event)."""
+        return EventTracker.try_extract(event)
 
     @staticmethod
     def get_occurrence_key(event: CalendarEvent) -> str:
         """Get unique key for an event occurrence (handles recurring events)."""
-        return f"{event.id}_{event.start_date.isoformat()}"
+        return f"{event.id}_{event.iso_start}"
 
     @staticmethod
     def create_placeholder_notes(